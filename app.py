@@ -57,19 +57,40 @@ These endpoints return plain JSON and work with simple HTTP requests.
 """
 
 import gradio as gr
+import atexit
+import functools
+import heapq
 import json
+import math
+import orjson
 import os
+import queue
+import re
+import shutil
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from html import escape
+from typing import Dict, List, Optional, Tuple
 import hashlib
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # FASTAPI REST ENDPOINTS (for web agents that can't run JavaScript)
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from fastapi import FastAPI, Request, Query
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # PERSISTENT STORAGE via Hugging Face Hub (Dataset repo, NOT Space repo)
@@ -80,18 +101,38 @@ SPACE_REPO_ID = "tostido/Wikai"  # The Space (don't upload here - triggers rebui
 DATA_REPO_ID = "tostido/Wikai"  # Dataset repo for patterns (same name, different type)
 PATTERNS_DIR = Path("patterns")
 PATTERNS_DIR.mkdir(exist_ok=True)
+NEXT_ID_FILE = PATTERNS_DIR / ".next_id"  # Last issued WIKAI_#### number
+
+
+def _pattern_path(filename: str) -> Path:
+    """Where a pattern file lives: one of 256 two-hex-digit shard directories.
+    
+    Sharding keeps each directory small as the Commons grows. Files from before
+    sharding may still sit directly in PATTERNS_DIR and are read from there.
+    """
+    shard = hashlib.blake2b(filename.encode(), digest_size=1).hexdigest()
+    return PATTERNS_DIR / shard / filename
+
+
+def _has_pattern_file(filename: str) -> bool:
+    return _pattern_path(filename).exists() or (PATTERNS_DIR / filename).exists()
 
 # Try to use HF Hub for persistence
 try:
-    from huggingface_hub import HfApi, hf_hub_download, upload_file, create_repo
+    from huggingface_hub import HfApi, hf_hub_download, snapshot_download, upload_file, create_repo, CommitOperationAdd
     HF_AVAILABLE = True
 except ImportError:
     HF_AVAILABLE = False
 
+_data_repo_ready = False  # Set once the dataset repo is known to exist
+
 def ensure_data_repo():
     """Create the data repo if it doesn't exist."""
+    global _data_repo_ready
     if not HF_AVAILABLE or not HF_TOKEN:
         return False
+    if _data_repo_ready:  # Checked once per process, not once per upload
+        return True
     try:
         api = HfApi(token=HF_TOKEN)
         try:
@@ -100,66 +141,125 @@ def ensure_data_repo():
             # Create it
             api.create_repo(repo_id=DATA_REPO_ID, repo_type="dataset", private=False)
             print(f"Created data repo: {DATA_REPO_ID}")
+        _data_repo_ready = True
         return True
     except Exception as e:
         print(f"Data repo setup failed: {e}")
         return False
 
+def _copy_from_hub(repo_id: str, repo_type: str, pf: str) -> bool:
+    """Download one pattern file unless we already have it. True if it was copied."""
+    dest = _pattern_path(Path(pf).name)
+    if _has_pattern_file(dest.name):
+        return False
+    try:
+        local_path = hf_hub_download(repo_id=repo_id, filename=pf, repo_type=repo_type, token=HF_TOKEN)
+        dest.parent.mkdir(exist_ok=True)
+        shutil.copy(local_path, dest)
+        return True
+    except:
+        return False
+
+
+def _copy_all_from_hub(repo_id: str, repo_type: str, pattern_files: List[str]) -> int:
+    """Fetch missing pattern files concurrently (each one is a network round trip)."""
+    if not pattern_files:
+        return 0
+    with ThreadPoolExecutor(max_workers=min(16, len(pattern_files))) as ex:
+        return sum(ex.map(lambda pf: _copy_from_hub(repo_id, repo_type, pf), pattern_files))
+
+
 def sync_from_hub():
     """Download patterns from HF Hub Dataset repo on startup."""
     if not HF_AVAILABLE or not HF_TOKEN:
         return
     try:
         api = HfApi(token=HF_TOKEN)
-        # Try dataset repo first
+        # Try dataset repo first: one batched snapshot instead of a request per file
         try:
-            files = api.list_repo_files(repo_id=DATA_REPO_ID, repo_type="dataset")
-            pattern_files = [f for f in files if f.endswith(".json")]
-            for pf in pattern_files:
-                try:
-                    local_path = hf_hub_download(repo_id=DATA_REPO_ID, filename=pf, repo_type="dataset", token=HF_TOKEN)
-                    dest = PATTERNS_DIR / Path(pf).name
-                    if not dest.exists():
-                        import shutil
-                        shutil.copy(local_path, dest)
-                except:
-                    pass
-            print(f"Synced {len(pattern_files)} patterns from {DATA_REPO_ID}")
+            local_dir = snapshot_download(repo_id=DATA_REPO_ID, repo_type="dataset", allow_patterns="*.json",
+                                          token=HF_TOKEN, max_workers=8)
+            synced = 0
+            for root, _, names in os.walk(local_dir):
+                for name in names:
+                    if not name.endswith(".json"):
+                        continue
+                    synced += 1
+                    if not _has_pattern_file(name):
+                        dest = _pattern_path(name)
+                        dest.parent.mkdir(exist_ok=True)
+                        shutil.copy(os.path.join(root, name), dest)
+            print(f"Synced {synced} patterns from {DATA_REPO_ID}")
         except:
             # Fallback: try space repo for legacy patterns
             files = api.list_repo_files(repo_id=SPACE_REPO_ID, repo_type="space")
             pattern_files = [f for f in files if f.startswith("patterns/") and f.endswith(".json")]
-            for pf in pattern_files:
-                try:
-                    local_path = hf_hub_download(repo_id=SPACE_REPO_ID, filename=pf, repo_type="space", token=HF_TOKEN)
-                    dest = PATTERNS_DIR / Path(pf).name
-                    if not dest.exists():
-                        import shutil
-                        shutil.copy(local_path, dest)
-                except:
-                    pass
+            _copy_all_from_hub(SPACE_REPO_ID, "space", pattern_files)
     except Exception as e:
         print(f"Hub sync failed: {e}")
 
-def save_to_hub(filename: str, content: str):
-    """Save a pattern file to HF Hub Dataset repo (NOT Space - avoids rebuild!)."""
-    if not HF_AVAILABLE or not HF_TOKEN:
+def save_batch_to_hub(files: List[Tuple[str, bytes]]):
+    """Save pattern files to HF Hub Dataset repo (NOT Space - avoids rebuild!) in one commit."""
+    if not HF_AVAILABLE or not HF_TOKEN or not files:
         return False
+    latest = dict(files)  # A file saved twice in one batch: keep the newest content
     try:
         ensure_data_repo()
         api = HfApi(token=HF_TOKEN)
-        api.upload_file(
-            path_or_fileobj=content.encode(),
-            path_in_repo=filename,  # No subdirectory needed in dataset repo
+        api.create_commit(
             repo_id=DATA_REPO_ID,
             repo_type="dataset",  # Dataset, not space!
-            commit_message=f"Add pattern: {filename}"
+            # No subdirectory needed in dataset repo
+            operations=[CommitOperationAdd(path_in_repo=name, path_or_fileobj=content)
+                        for name, content in latest.items()],
+            commit_message=(f"Add pattern: {next(iter(latest))}" if len(latest) == 1
+                            else f"Add {len(latest)} patterns")
         )
         return True
     except Exception as e:
         print(f"Hub save failed: {e}")
         return False
 
+# Uploads run on one background worker, in submission order, so a submit is
+# acknowledged once the local write lands instead of after the Hub round trip.
+# Files queued while a commit is in flight go up together in the next one.
+HUB_BATCH_MAX = 32
+_upload_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+_upload_thread: Optional[threading.Thread] = None
+_upload_lock = threading.Lock()
+
+def _upload_worker():
+    while True:
+        batch = [_upload_queue.get()]
+        while len(batch) < HUB_BATCH_MAX:
+            try:
+                batch.append(_upload_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            save_batch_to_hub(batch)
+        finally:
+            for _ in batch:
+                _upload_queue.task_done()
+
+def queue_hub_upload(filename: str, content: bytes):
+    """Schedule a pattern file for upload to the Hub dataset repo."""
+    global _upload_thread
+    if not HF_AVAILABLE or not HF_TOKEN:
+        return
+    with _upload_lock:
+        if _upload_thread is None:
+            _upload_thread = threading.Thread(target=_upload_worker, name="hub-upload", daemon=True)
+            _upload_thread.start()
+    _upload_queue.put((filename, content))
+
+@atexit.register
+def _drain_uploads(timeout: float = 30.0):
+    """Give queued uploads a bounded chance to finish before the process exits."""
+    deadline = time.monotonic() + timeout
+    while _upload_queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.1)
+
 # Sync on startup
 sync_from_hub()
 
@@ -167,9 +267,6 @@ sync_from_hub()
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-PATTERNS_DIR = Path("patterns")
-PATTERNS_DIR.mkdir(exist_ok=True)
-
 DOMAINS = [
     "Healthcare", "Finance", "Robotics", "NLP", "Computer Vision",
     "Autonomous Systems", "Scientific Discovery", "Education",
@@ -192,62 +289,602 @@ MODALITIES = [
     "Sensor Data", "Behavioral", "Biological", "Chemical", "Physical"
 ]
 
+MAX_SUBMISSION_CHARS = 256_000  # API submissions larger than this are rejected unparsed
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # STORAGE
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def load_patterns() -> List[Dict]:
-    patterns = []
-    for path in PATTERNS_DIR.glob("*.json"):
+# Parsed patterns keyed by file path -> ((st_mtime_ns, st_size), pattern). Only
+# files whose stamp changed since the last scan are re-read, so warm loads touch
+# no JSON. The size catches rewrites within one tick of a coarse-mtime filesystem.
+_PATTERN_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+_CACHE_LOCK = threading.RLock()  # Gradio's queue runs handlers on worker threads
+_CACHE_EPOCH = 0  # Bumped on every cache change; keys the derived memoized views
+_CACHE_CHANGED = time.time()  # When _CACHE_EPOCH was last bumped (the feed's lastBuildDate)
+# Cached patterns oldest first by (timestamp, id), with their keys alongside for
+# bisect. Single saves and edits are inserted/removed in place; only a bulk
+# change (cold start, Hub sync) drops the order for load_patterns to re-sort.
+_ORDERED: List[Dict] = []
+_ORDER_KEYS: List[Tuple[str, str]] = []
+_ORDER_VALID = False
+# Saves from this process write through to the cache, so the directory only
+# needs re-sweeping to notice outside changes (other workers, manual edits).
+# A burst of UI events within this many seconds shares one sweep.
+RESCAN_INTERVAL = 1.0
+_LAST_SCAN = float("-inf")  # time.monotonic() of the last sweep
+_ID_TO_PATH: Dict[str, str] = {}  # Pattern ID -> file it was read from
+_MAX_ID_NUM = 0  # Highest WIKAI_#### number ever seen in the cache (never lowered)
+
+# Search index, maintained alongside the cache: lowercased searchable text per
+# pattern ID, and word -> IDs postings used to shortlist multi-word queries.
+_PATTERN_BLOB: Dict[str, str] = {}
+_ABSTRACT_BLOB: Dict[str, str] = {}  # Lowercased non-empty abstracts, for the API search
+_INVERTED: Dict[str, set] = {}
+_WORD_RE = re.compile(r"\w+")
+
+# Tag index: lowercased tag -> number of entries, and -> IDs of those entries
+_TAG_COUNTS: Counter = Counter()
+_TAG_INDEX: Dict[str, set] = {}
+
+# Domain -> IDs, knowledge type -> IDs, and entry ID -> IDs of the entries that
+# list it in their related_entries; candidate sources for related entries
+_DOMAIN_INDEX: Dict[Optional[str], set] = {}
+_TYPE_INDEX: Dict[Optional[str], set] = {}
+_LINKED_FROM: Dict[str, set] = {}
+
+# Running totals for the Statistics tab
+_STATS = {
+    "count": 0,
+    "stability_sum": 0.0,
+    "domains": Counter(),
+    "types": Counter(),
+    "tags": Counter(),
+    "origins": Counter(),
+}
+
+# Rendered entry cards: ID -> (pattern dict, markdown). A re-read file yields a
+# new dict, so a card is only reused for the exact object it was rendered from.
+_CARD_CACHE: Dict[str, Tuple[Dict, str]] = {}
+# Same scheme for the dropdown label and table row shown for each entry
+_LABEL_CACHE: Dict[str, Tuple[Dict, str]] = {}
+_ROW_CACHE: Dict[str, Tuple[Dict, List[str]]] = {}
+
+
+def _str_or(value, default: str = '') -> str:
+    """`value` if it's a string, else `default`: pattern files are free-form JSON."""
+    return value if isinstance(value, str) else default
+
+
+def _str_list(value) -> List[str]:
+    """The string items of a list field; anything else contributes nothing."""
+    return [x for x in value if isinstance(x, str)] if isinstance(value, list) else []
+
+
+def _index_key(value) -> bool:
+    """Whether a domain / knowledge type value can be filed in its index."""
+    return value is None or isinstance(value, str)
+
+
+def _metric(p: Dict, name: str, default: float = 0.0) -> float:
+    """A metric as a finite float; missing, null, NaN and junk values read as `default`."""
+    metrics = p.get('metrics')
+    try:
+        value = float(metrics.get(name, default)) if isinstance(metrics, dict) else default
+    except (TypeError, ValueError):
+        return default
+    return value if math.isfinite(value) else default
+
+
+def _stability(p: Dict) -> float:
+    return _metric(p, 'stability_score')
+
+
+def _update_stats(p: Dict, sign: int):
+    """Add (sign=1) or remove (sign=-1) one pattern from the running totals."""
+    _STATS["count"] += sign
+    _STATS["stability_sum"] += sign * _stability(p)
+    def _field_key(field, default):
+        value = p.get(field, default)
+        return value if _index_key(value) else default
+    keys = [
+        (_STATS["domains"], _field_key('domain', '?')),
+        (_STATS["types"], _field_key('knowledge_type', '?')),
+        (_STATS["origins"], _field_key('origin', 'unknown')),
+    ] + [(_STATS["tags"], t) for t in _str_list(p.get('tags'))]
+    for counter, key in keys:
+        counter[key] += sign
+        if counter[key] <= 0:
+            del counter[key]
+
+
+def _discard_posting(index: Dict, key, pid):
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(pid)
+        if not ids:
+            del index[key]
+
+
+def _id_number(pid) -> int:
+    """The #### of a WIKAI_#### id, or 0 for anything else."""
+    if isinstance(pid, str) and pid.startswith('WIKAI_'):
+        digits = pid[6:].partition('_')[0]
+        if digits.isdecimal():
+            return int(digits)
+    return 0
+
+
+def _index_pattern(p: Dict):
+    global _MAX_ID_NUM
+    _update_stats(p, 1)
+    pid = p.get('id')
+    _MAX_ID_NUM = max(_MAX_ID_NUM, _id_number(pid))
+    blob = '\0'.join([_str_or(p.get('title')), _str_or(p.get('axiom')), *_str_list(p.get('tags'))]).lower()
+    _PATTERN_BLOB[pid] = blob
+    abstract = p.get('abstract')
+    if abstract and isinstance(abstract, str):
+        _ABSTRACT_BLOB[pid] = abstract.lower()
+    for word in set(_WORD_RE.findall(blob)):
+        _INVERTED.setdefault(word, set()).add(pid)
+    for tag in _str_list(p.get('tags')):
+        tag_lower = tag.lower()
+        _TAG_COUNTS[tag_lower] += 1
+        _TAG_INDEX.setdefault(tag_lower, set()).add(pid)
+    for index, value in ((_DOMAIN_INDEX, p.get('domain')), (_TYPE_INDEX, p.get('knowledge_type'))):
+        if _index_key(value):
+            index.setdefault(value, set()).add(pid)
+    for linked in _str_list(p.get('related_entries')):
+        _LINKED_FROM.setdefault(linked, set()).add(pid)
+
+
+def _unindex_pattern(p: Dict):
+    _update_stats(p, -1)
+    _CARD_CACHE.pop(p.get('id'), None)
+    _LABEL_CACHE.pop(p.get('id'), None)
+    _ROW_CACHE.pop(p.get('id'), None)
+    blob = _PATTERN_BLOB.pop(p.get('id'), '')
+    _ABSTRACT_BLOB.pop(p.get('id'), None)
+    for word in set(_WORD_RE.findall(blob)):
+        _discard_posting(_INVERTED, word, p.get('id'))
+    for tag in _str_list(p.get('tags')):
+        tag_lower = tag.lower()
+        _TAG_COUNTS[tag_lower] -= 1
+        if _TAG_COUNTS[tag_lower] <= 0:
+            del _TAG_COUNTS[tag_lower]
+        _discard_posting(_TAG_INDEX, tag_lower, p.get('id'))
+    for index, value in ((_DOMAIN_INDEX, p.get('domain')), (_TYPE_INDEX, p.get('knowledge_type'))):
+        if _index_key(value):
+            _discard_posting(index, value, p.get('id'))
+    for linked in _str_list(p.get('related_entries')):
+        _discard_posting(_LINKED_FROM, linked, p.get('id'))
+
+
+def _stamp(st: os.stat_result) -> Tuple[int, int]:
+    return st.st_mtime_ns, st.st_size
+
+
+def _recency(p: Dict) -> Tuple[str, str]:
+    return _str_or(p.get('timestamp')), _str_or(p.get('id'))
+
+
+def _order_insert(p: Dict):
+    key = _recency(p)
+    i = bisect_right(_ORDER_KEYS, key)
+    _ORDER_KEYS.insert(i, key)
+    _ORDERED.insert(i, p)
+
+
+def _order_remove(p: Dict):
+    key = _recency(p)
+    i = bisect_left(_ORDER_KEYS, key)
+    while i < len(_ORDERED) and _ORDER_KEYS[i] == key:
+        if _ORDERED[i] is p:
+            del _ORDER_KEYS[i], _ORDERED[i]
+            return
+        i += 1
+
+
+def _cache_put(path: str, stamp: Tuple[int, int], pattern: Dict):
+    global _CACHE_EPOCH, _CACHE_CHANGED
+    _CACHE_EPOCH += 1
+    _CACHE_CHANGED = time.time()
+    old = _PATTERN_CACHE.get(path)
+    if _ORDER_VALID:
+        if old:
+            _order_remove(old[1])
+        _order_insert(pattern)
+    if old:
+        _unindex_pattern(old[1])
+        if _ID_TO_PATH.get(old[1].get('id')) == path:
+            del _ID_TO_PATH[old[1].get('id')]
+    _PATTERN_CACHE[path] = (stamp, pattern)
+    _ID_TO_PATH[pattern.get('id')] = path
+    _index_pattern(pattern)
+
+
+def _cache_evict(path: str):
+    global _CACHE_EPOCH, _CACHE_CHANGED
+    old = _PATTERN_CACHE.pop(path, None)
+    if old:
+        _CACHE_EPOCH += 1
+        _CACHE_CHANGED = time.time()
+        if _ORDER_VALID:
+            _order_remove(old[1])
+        _unindex_pattern(old[1])
+        if _ID_TO_PATH.get(old[1].get('id')) == path:
+            del _ID_TO_PATH[old[1].get('id')]
+
+
+def _read_pattern(path: str) -> Optional[Dict]:
+    """Parse one pattern file, or None if it's unreadable / not a JSON object
+    (or has an ID that isn't a string, so couldn't be looked up)."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except:
+        return None
+    try:
+        pattern = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Legacy files written by the stdlib may hold NaN/Infinity, which
+        # orjson refuses; metrics are read through _metric() either way
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                patterns.append(json.load(f))
+            pattern = json.loads(data)
         except:
-            pass
-    # Sort by timestamp first (newest first), then by ID as fallback
-    return sorted(patterns, key=lambda p: (p.get('timestamp', ''), p.get('id', '')), reverse=True)
+            return None
+    if not isinstance(pattern, dict) or not isinstance(pattern.get('id', ''), str):
+        return None
+    return pattern
+
+
+def _cache_store(path: str, stamp: Tuple[int, int], pattern: Optional[Dict]):
+    """Cache a freshly read pattern. One that fails to index is dropped like an
+    unreadable file, so a single bad file can't take the whole Commons down."""
+    if pattern is not None:
+        try:
+            _cache_put(path, stamp, pattern)
+            return
+        except Exception as e:
+            print(f"Skipping pattern file {path}: {e}")
+    _cache_evict(path)
+
+
+def _pattern_entries():
+    """DirEntry of every pattern file, in the shard directories and (legacy) at the top level."""
+    with os.scandir(PATTERNS_DIR) as it:
+        top = list(it)
+    for entry in top:
+        if entry.name.endswith(".json") and entry.is_file():
+            yield entry
+        elif len(entry.name) == 2 and entry.is_dir():
+            with os.scandir(entry.path) as it:
+                yield from (e for e in it if e.name.endswith(".json") and e.is_file())
+
+
+def _sweep_patterns():
+    """Bring the cache in line with the pattern files on disk (caller holds the lock)."""
+    global _ORDER_VALID
+    seen = set()
+    stale = []  # (path, stamp) of new or modified files
+    for entry in _pattern_entries():
+        try:
+            stamp = _stamp(entry.stat())
+        except OSError:
+            continue
+        seen.add(entry.path)
+        cached = _PATTERN_CACHE.get(entry.path)
+        if not cached or cached[0] != stamp:
+            stale.append((entry.path, stamp))
+    
+    paths = [path for path, _ in stale]
+    if len(paths) >= 16:
+        _ORDER_VALID = False  # Cheaper to re-sort once than to insert one by one
+    if len(paths) > 1 and (not _PATTERN_CACHE or len(paths) >= 16):
+        # Cold start or a large batch of new files (e.g. after a Hub sync):
+        # overlap the reads (file I/O and orjson both release the GIL)
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(paths))) as ex:
+            parsed = list(ex.map(_read_pattern, paths))
+    else:
+        parsed = [_read_pattern(path) for path in paths]
+    
+    for (path, stamp), pattern in zip(stale, parsed):
+        _cache_store(path, stamp, pattern)
+    
+    # Evict files that disappeared from disk
+    for path in _PATTERN_CACHE.keys() - seen:
+        _cache_evict(path)
+
+
+def load_patterns() -> List[Dict]:
+    global _ORDER_VALID, _LAST_SCAN
+    with _CACHE_LOCK:
+        now = time.monotonic()
+        if now - _LAST_SCAN >= RESCAN_INTERVAL:
+            _sweep_patterns()
+            _LAST_SCAN = now
+        
+        if not _ORDER_VALID:
+            # Sort by timestamp first, then by ID as fallback
+            _ORDERED[:] = sorted((p for _, p in _PATTERN_CACHE.values()), key=_recency)
+            _ORDER_KEYS[:] = map(_recency, _ORDERED)
+            _ORDER_VALID = True
+        return _ORDERED[::-1]  # Newest first
+
+
+def get_pattern(pid: str) -> Optional[Dict]:
+    """One pattern by ID, re-reading only its own file if it changed on disk."""
+    with _CACHE_LOCK:
+        path = _ID_TO_PATH.get(pid)
+        if path is None:
+            # Not seen yet (e.g. a file that arrived from the Hub): rescan once
+            load_patterns()
+            path = _ID_TO_PATH.get(pid)
+            if path is None:
+                return None
+        try:
+            stamp = _stamp(os.stat(path))
+        except OSError:
+            _cache_evict(path)
+            return None
+        if _PATTERN_CACHE[path][0] != stamp:
+            _cache_store(path, stamp, _read_pattern(path))
+            if path not in _PATTERN_CACHE:
+                return None
+        pattern = _PATTERN_CACHE[path][1]
+    return pattern if pattern.get('id') == pid else None
+
+
+# Vocabulary views over the indexed words, rebuilt lazily when the cache epoch
+# moves: all words joined by newlines with each word's start offset (so the
+# words containing a fragment can be found with one C-level scan), plus the
+# words sorted forwards and reversed (so prefixes and suffixes are a bisect).
+_VOCAB: Tuple[str, List[int], List[str], List[str], List[str]] = ("", [], [], [], [])
+_VOCAB_EPOCH = -1
+
+
+def _vocab():
+    global _VOCAB, _VOCAB_EPOCH
+    if _VOCAB_EPOCH != _CACHE_EPOCH:
+        words = list(_INVERTED)
+        starts, pos = [], 0
+        for w in words:
+            starts.append(pos)
+            pos += len(w) + 1
+        _VOCAB = ("\n".join(words), starts, words, sorted(words), sorted(w[::-1] for w in words))
+        _VOCAB_EPOCH = _CACHE_EPOCH
+    return _VOCAB
+
+
+def _sorted_range(keys: List[str], prefix: str) -> List[str]:
+    """The entries of sorted `keys` starting with `prefix`."""
+    i = j = bisect_left(keys, prefix)
+    while j < len(keys) and keys[j].startswith(prefix):
+        j += 1
+    return keys[i:j]
+
+
+def _ids_for_fragment(fragment: str, prefix: bool = False, suffix: bool = False) -> Optional[set]:
+    """IDs of patterns with an indexed word containing `fragment` (or, with
+    `prefix` / `suffix`, starting / ending with it).
+    
+    Returns None when the fragment is too common to be worth shortlisting on.
+    """
+    text, starts, words, forwards, backwards = _vocab()
+    if prefix:
+        matched = _sorted_range(forwards, fragment)
+    elif suffix:
+        matched = [w[::-1] for w in _sorted_range(backwards, fragment[::-1])]
+    else:
+        matched, last = [], -1
+        for m in re.finditer(re.escape(fragment), text):
+            i = bisect_right(starts, m.start()) - 1
+            if i != last:
+                matched.append(words[i])
+                last = i
+                if len(matched) > len(_PATTERN_BLOB):
+                    break
+    
+    if len(matched) > len(_PATTERN_BLOB):
+        return None  # Scanning the blobs directly is cheaper
+    ids = set()
+    for w in matched:
+        ids |= _INVERTED[w]
+    return ids
+
+
+def search_ids(query: str, abstract: bool = False) -> frozenset:
+    """IDs of patterns whose title, axiom or tags (and, optionally, abstract)
+    contain `query` (case-insensitive)."""
+    with _CACHE_LOCK:
+        return _search_ids(query.lower(), abstract, _CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=256)
+def _search_ids(q: str, abstract: bool, epoch: int) -> frozenset:
+    """Search the index as of one cache epoch (caller holds the lock).
+    
+    Repeated queries, and the refreshes that re-run the current one, are
+    served from the memo until a pattern is added, changed or removed.
+    """
+    if abstract:
+        return _search_ids(q, False, epoch) | {pid for pid, text in _ABSTRACT_BLOB.items() if q in text}
+    
+    # Every word in the query narrows the candidates: a word bounded by
+    # non-word characters on both sides must appear as a whole word in a
+    # match, one bounded on just its left (right) must start (end) a word,
+    # and an unbounded one must at least be part of one. Survivors are then
+    # verified with a plain substring check.
+    candidates = None
+    for m in _WORD_RE.finditer(q):
+        bounded_left, bounded_right = m.start() > 0, m.end() < len(q)
+        if bounded_left and bounded_right:
+            ids = _INVERTED.get(m.group(), set())
+        else:
+            ids = _ids_for_fragment(m.group(), prefix=bounded_left, suffix=bounded_right)
+            if ids is None:
+                continue
+        candidates = ids if candidates is None else candidates & ids
+    
+    if candidates is None:
+        blobs = _PATTERN_BLOB.items()
+    else:
+        blobs = ((pid, _PATTERN_BLOB[pid]) for pid in candidates)
+    return frozenset(pid for pid, blob in blobs if q in blob)
+
+
+_JSON_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+_EMPTY: Dict = {}  # Shared read-only default for missing sub-dicts (never mutate)
+_SLUG_RE = re.compile(r"[\W_]")  # Any non-alphanumeric character, one at a time
+
+
+def to_json(obj) -> str:
+    """Pretty-printed (2-space) UTF-8 JSON text."""
+    return orjson.dumps(obj, option=_JSON_PRETTY).decode()
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with a 'Z' suffix (the entry timestamp format)."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def content_hash(title: str, axiom: str) -> str:
+    """16-hex-digit fingerprint of an entry's title and axiom.
+    
+    Feeds SHA-256 the exact bytes of json.dumps({"t": title, "a": axiom},
+    sort_keys=True) piecewise, so hashes match entries saved by earlier
+    versions without building the dict or the combined string.
+    """
+    h = hashlib.sha256(b'{"a": ')
+    h.update(json.dumps(axiom, sort_keys=True).encode())
+    h.update(b', "t": ')
+    h.update(json.dumps(title, sort_keys=True).encode())
+    h.update(b'}')
+    return h.hexdigest()[:16]
+
+
+_STR_FIELDS = ('title', 'axiom', 'abstract', 'domain', 'knowledge_type', 'origin', 'version')
+_STR_LIST_FIELDS = ('tags', 'modalities', 'reasoning_chain', 'compatible_domains',
+                    'prerequisites', 'dependencies', 'contraindications', 'related_entries')
+
+
+def entry_type_error(entry: Dict) -> Optional[str]:
+    """Why a submitted entry's fields can't be stored as given, or None if they can."""
+    for field in _STR_FIELDS:
+        if field in entry and not isinstance(entry[field], str):
+            return f"{field} must be a string"
+    for field in _STR_LIST_FIELDS:
+        value = entry.get(field, [])
+        if not isinstance(value, list) or not all(isinstance(x, str) for x in value):
+            return f"{field} must be a list of strings"
+    if not isinstance(entry.get('mechanism', {}), dict):
+        return "mechanism must be an object"
+    metrics = entry.get('metrics', {})
+    if not isinstance(metrics, dict):
+        return "metrics must be an object"
+    for name, value in metrics.items():
+        # orjson would store NaN/inf as null
+        if isinstance(value, float) and not math.isfinite(value):
+            return f"{name} must be a finite number"
+    return None
 
 
 def save_pattern(pattern: Dict) -> str:
     pattern_id = pattern['id']
-    title_slug = ''.join(c if c.isalnum() else '_' for c in pattern['title'].lower()[:30])
+    title_slug = _SLUG_RE.sub('_', pattern['title'].lower()[:30])
     filename = f"{pattern_id}_{title_slug}.json"
-    filepath = PATTERNS_DIR / filename
-    content = json.dumps(pattern, indent=2, ensure_ascii=False)
+    filepath = _pattern_path(filename)
+    content = orjson.dumps(pattern, option=_JSON_PRETTY)
+    
+    # Save locally: write a hidden temp file and rename it into place, so a
+    # crash mid-write never leaves a truncated pattern for load_patterns()
+    filepath.parent.mkdir(exist_ok=True)
+    tmp_path = filepath.parent / f".{filename}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, filepath)
+    except:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    (PATTERNS_DIR / filename).unlink(missing_ok=True)  # Superseded pre-sharding copy
     
-    # Save locally
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Write-through so the next load_patterns() doesn't re-read this file
+    with _CACHE_LOCK:
+        _cache_evict(str(PATTERNS_DIR / filename))
+        _cache_put(str(filepath), _stamp(os.stat(filepath)), pattern)
     
     # Save to HF Hub for persistence
-    save_to_hub(filename, content)
+    queue_hub_upload(filename, content)  # The same bytes that were written locally
     
     return pattern_id
 
 
+def _scan_max_id() -> int:
+    """Highest WIKAI_#### number in the Commons (a floor for the id counter)."""
+    load_patterns()
+    with _CACHE_LOCK:
+        return _MAX_ID_NUM
+
+
+def _lock_file(f, lock: bool = True):
+    """Exclusive lock on an open file (fcntl on POSIX, msvcrt on Windows)."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if lock else fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if lock else msvcrt.LK_UNLCK, 1)
+
+
 def get_next_id() -> str:
-    patterns = load_patterns()
-    max_num = 0
-    for p in patterns:
-        pid = p.get('id', '')
-        if pid.startswith('WIKAI_'):
+    """Reserve the next pattern ID from the on-disk counter.
+    
+    The counter file holds the last issued number as 8 zero-padded digits and
+    is seeded by a single scan of the Commons the first time it's needed. The
+    file lock keeps ids unique across concurrent workers. Files written by
+    anything else (the librarian, the Flask UI, hand edits) only reach the
+    counter through the cache, so the highest cached id is a floor for it.
+    """
+    fd = os.open(NEXT_ID_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    with os.fdopen(fd, 'r+', encoding='utf-8') as f:
+        _lock_file(f)
+        try:
+            f.seek(0)
             try:
-                max_num = max(max_num, int(pid.split('_')[1]))
-            except:
-                pass
-    return f"WIKAI_{max_num + 1:04d}"
+                last = int(f.read().strip())
+            except ValueError:
+                last = 0
+            next_num = max(last, _scan_max_id()) + 1
+            # Overwrite in place as one fixed-width record rather than
+            # truncate-then-write, so a crash can't leave a shorter number
+            # behind that would hand out an ID a second time
+            f.seek(0)
+            f.write(f"{next_num:08d}")
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            _lock_file(f, lock=False)
+    return f"WIKAI_{next_num:04d}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # INTERLINK SYSTEM - Tags, Cross-References, Knowledge Graph
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def get_tag_counts() -> Dict[str, int]:
+    """All (lowercased) tags with entry counts, most used first."""
+    load_patterns()
+    with _CACHE_LOCK:
+        return dict(_TAG_COUNTS.most_common())
+
+
 def build_tag_index() -> Dict[str, List[Dict]]:
     """Build an index of all tags -> entries that have them."""
     patterns = load_patterns()
     index = {}
     for p in patterns:
-        for tag in p.get('tags', []):
+        for tag in _str_list(p.get('tags')):
             tag_lower = tag.lower()
             if tag_lower not in index:
                 index[tag_lower] = []
@@ -265,32 +902,48 @@ def build_domain_index() -> Dict[str, List[Dict]]:
     index = {}
     for p in patterns:
         domain = p.get('domain', 'General')
+        if not _index_key(domain):
+            domain = 'General'
         if domain not in index:
             index[domain] = []
         index[domain].append({
             'id': p.get('id'),
             'title': p.get('title'),
-            'axiom': p.get('axiom', '')[:100]
+            'axiom': _str_or(p.get('axiom'))[:100]
         })
     return index
 
 
 def find_related_entries(entry_id: str) -> List[Dict]:
     """Find entries related to a given entry by shared tags, domain, or explicit links."""
-    patterns = load_patterns()
-    target = next((p for p in patterns if p.get('id') == entry_id), None)
+    load_patterns()
+    target = get_pattern(entry_id)
     if not target:
         return []
     
     related = []
-    target_tags = set(t.lower() for t in target.get('tags', []))
     target_domain = target.get('domain', '')
-    explicit_related = set(target.get('related_entries', []))
+    # Shared tags per entry, straight from the tag postings (in the target's tag order)
+    shared_by_id: Dict[str, List[str]] = {}
+    explicit_related = set(_str_list(target.get('related_entries')))
+    with _CACHE_LOCK:
+        for tag in dict.fromkeys(t.lower() for t in _str_list(target.get('tags'))):
+            for pid in _TAG_INDEX.get(tag, ()):
+                shared_by_id.setdefault(pid, []).append(tag)
+        # Only entries in one of these postings can score above zero
+        target_type = target.get('knowledge_type')
+        candidates = set(shared_by_id).union(
+            _DOMAIN_INDEX.get(target_domain, ()) if _index_key(target_domain) else (),
+            _TYPE_INDEX.get(target_type, ()) if _index_key(target_type) else (),
+            _LINKED_FROM.get(entry_id, ()),
+            explicit_related,
+        )
+        candidates.discard(entry_id)
+        # Newest first, as in load_patterns(), without walking the whole library
+        matches = sorted((_PATTERN_CACHE[_ID_TO_PATH[pid]][1] for pid in candidates if pid in _ID_TO_PATH),
+                         key=_recency, reverse=True)
     
-    for p in patterns:
-        if p.get('id') == entry_id:
-            continue
-        
+    for p in matches:
         score = 0
         reasons = []
         
@@ -300,8 +953,7 @@ def find_related_entries(entry_id: str) -> List[Dict]:
             reasons.append("explicitly linked")
         
         # Shared tags
-        p_tags = set(t.lower() for t in p.get('tags', []))
-        shared_tags = target_tags & p_tags
+        shared_tags = shared_by_id.get(p.get('id'))
         if shared_tags:
             score += len(shared_tags) * 2
             reasons.append(f"shares tags: {', '.join(shared_tags)}")
@@ -325,29 +977,35 @@ def find_related_entries(entry_id: str) -> List[Dict]:
                 'reasons': reasons
             })
     
-    return sorted(related, key=lambda x: -x['score'])[:10]
+    return heapq.nlargest(10, related, key=lambda x: x['score'])
 
 
 def get_tag_page(tag: str) -> str:
     """Get a page showing all entries with a specific tag."""
-    tag_index = build_tag_index()
+    patterns = load_patterns()
     tag_lower = tag.lower()
+    with _CACHE_LOCK:
+        ids = set(_TAG_INDEX.get(tag_lower, ()))
     
-    if tag_lower not in tag_index:
+    if not ids:
         return f"No entries found with tag `{tag}`.\n\n" + get_landing_page()
     
-    entries = tag_index[tag_lower]
+    entries = [{
+        'id': p.get('id'),
+        'title': p.get('title'),
+        'axiom': p.get('axiom', '')[:100]
+    } for p in patterns if p.get('id') in ids]
     
-    output = f"""
+    parts = [f"""
 # 🏷️ Tag: `{tag}`
 
 **{len(entries)} entries** with this tag
 
 ---
 
-"""
+"""]
     for e in entries:
-        output += f"""
+        parts.append(f"""
 ### 📖 [{e['title']}]
 **ID:** `{e['id']}`
 > *"{e['axiom']}"*
@@ -355,20 +1013,27 @@ def get_tag_page(tag: str) -> str:
 *Select from dropdown to view full details*
 
 ---
-"""
+""")
     
-    output += """
+    parts.append("""
 *← Use the search/filter above or select an entry from the dropdown*
-"""
-    return output
+""")
+    return "".join(parts)
 
 
 def get_knowledge_graph() -> str:
     """Generate a text-based knowledge graph showing relationships."""
+    load_patterns()
+    return _knowledge_graph(_CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=2)
+def _knowledge_graph(epoch: int) -> str:
+    """The rendered graph for one cache epoch."""
     patterns = load_patterns()
     tag_index = build_tag_index()
     
-    output = """
+    parts = ["""
 # 🕸️ Knowledge Graph
 
 This shows how entries are connected through shared tags and relationships.
@@ -377,76 +1042,134 @@ This shows how entries are connected through shared tags and relationships.
 
 ## 📊 Tag Clusters
 
-"""
+"""]
     
     # Show top tags and their entries
     sorted_tags = sorted(tag_index.items(), key=lambda x: -len(x[1]))[:15]
     
     for tag, entries in sorted_tags:
-        output += f"""
+        parts.append(f"""
 ### `{tag}` ({len(entries)} entries)
-"""
+""")
         for e in entries[:5]:
-            output += f"- **{e['title']}** (`{e['id']}`)\n"
+            parts.append(f"- **{e['title']}** (`{e['id']}`)\n")
         if len(entries) > 5:
-            output += f"- *...and {len(entries) - 5} more*\n"
-        output += "\n"
+            parts.append(f"- *...and {len(entries) - 5} more*\n")
+        parts.append("\n")
     
-    output += """
+    parts.append("""
 ---
 
 ## 🔗 Cross-References
 
 Entries that explicitly link to each other:
 
-"""
+""")
     
     # Show explicit relationships
     has_links = False
     for p in patterns:
-        related = p.get('related_entries', [])
-        prereqs = p.get('prerequisites', [])
-        deps = p.get('dependencies', [])
+        related = _str_list(p.get('related_entries'))
+        prereqs = _str_list(p.get('prerequisites'))
+        deps = _str_list(p.get('dependencies'))
         
         all_links = related + prereqs + deps
         if all_links:
             has_links = True
-            output += f"**{p.get('title')}** (`{p.get('id')}`):\n"
+            parts.append(f"**{p.get('title')}** (`{p.get('id')}`):\n")
             if related:
-                output += f"  - Related: {', '.join(related)}\n"
+                parts.append(f"  - Related: {', '.join(related)}\n")
             if prereqs:
-                output += f"  - Prerequisites: {', '.join(prereqs)}\n"
+                parts.append(f"  - Prerequisites: {', '.join(prereqs)}\n")
             if deps:
-                output += f"  - Dependencies: {', '.join(deps)}\n"
-            output += "\n"
+                parts.append(f"  - Dependencies: {', '.join(deps)}\n")
+            parts.append("\n")
     
     if not has_links:
-        output += "*No explicit cross-references yet. Add them when submitting entries!*\n"
+        parts.append("*No explicit cross-references yet. Add them when submitting entries!*\n")
     
-    output += """
+    parts.append("""
 ---
 
 ## 🌐 Domain Distribution
 
-"""
+""")
     
     domain_index = build_domain_index()
     for domain, entries in sorted(domain_index.items(), key=lambda x: -len(x[1])):
-        output += f"- **{domain}**: {len(entries)} entries\n"
+        parts.append(f"- **{domain}**: {len(entries)} entries\n")
     
-    return output
+    return "".join(parts)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # LANDING PAGE - Shows most recent entry + list of all entries
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def format_entry_card(p: Dict) -> str:
+    """Summary card for one entry (memoized until its file changes)."""
+    pid = p.get('id', '?')
+    cached = _CARD_CACHE.get(pid)
+    if cached and cached[0] is p:
+        return cached[1]
+    
+    title = p.get('title', 'Untitled')
+    domain = p.get('domain', 'General')
+    ktype = p.get('knowledge_type', 'Pattern')
+    axiom = p.get('axiom', '')
+    abstract = p.get('abstract', '')
+    stability = _stability(p)
+    fitness = _metric(p, 'fitness_delta')
+    transfer = _metric(p, 'transferability')
+    tags = p.get('tags', [])
+    origin = p.get('origin', 'unknown')
+    timestamp = p.get('timestamp', 'unknown')
+    reasoning = p.get('reasoning_chain', [])
+    
+    parts = [f"""
+### 📖 {title}
+
+**`{pid}`** | {ktype} | {domain} | by *{origin}* | {timestamp[:10] if len(timestamp) > 10 else timestamp}
+
+> **"{axiom}"**
+
+"""]
+    if abstract:
+        parts.append(f"{abstract}\n\n")
+    
+    parts.append(f"""| Stability | Fitness | Transferability |
+|-----------|---------|-----------------|
+| **{stability*100:.0f}%** | **{fitness:+.2f}** | **{transfer*100:.0f}%** |
+
+""")
+    if reasoning:
+        parts.append("**Reasoning:** ")
+        parts.append(" → ".join(reasoning[:3]))
+        if len(reasoning) > 3:
+            parts.append(f" → *...{len(reasoning)-3} more steps*")
+        parts.append("\n\n")
+    
+    if tags:
+        parts.append(f"**Tags:** {', '.join(f'`{t}`' for t in tags)}\n\n")
+    
+    card = "".join(parts)
+    _CARD_CACHE[pid] = (p, card)
+    return card
+
+
 def get_landing_page() -> str:
+    load_patterns()
+    return _landing_page(_CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=2)
+def _landing_page(epoch: int) -> str:
+    """The rendered landing page for one cache epoch."""
     patterns = load_patterns()  # Already sorted newest first
     count = len(patterns)
     
     # Compact header
-    output = f"""
+    parts = [f"""
 # 🌐 WIKAI Commons — {count} entries
 
 *The Wikipedia for AI. AI systems and humans share knowledge here.*
@@ -455,10 +1178,10 @@ def get_landing_page() -> str:
 
 ---
 
-"""
+"""]
     
     if not patterns:
-        output += """
+        parts.append("""
 ## 🚀 No entries yet
 
 *Be the first to contribute! Use the **➕ Submit** tab or the API.*
@@ -477,67 +1200,28 @@ A shared knowledge repository where AI discoveries are stored and retrieved.
 | **Axiom** | Core truth/principle |
 | **Stability** | How reliably it works (0-100%) |
 | **Transferability** | Cross-domain applicability |
-"""
+""")
     else:
         # ═══════════════════════════════════════════════════════════════════
         # FEATURED: Most Recent Entry
         # ═══════════════════════════════════════════════════════════════════
-        latest = patterns[0]
-        pid = latest.get('id', '?')
-        title = latest.get('title', 'Untitled')
-        domain = latest.get('domain', 'General')
-        ktype = latest.get('knowledge_type', 'Pattern')
-        axiom = latest.get('axiom', '')
-        abstract = latest.get('abstract', '')
-        stability = latest.get('metrics', {}).get('stability_score', 0)
-        fitness = latest.get('metrics', {}).get('fitness_delta', 0)
-        transfer = latest.get('metrics', {}).get('transferability', 0)
-        tags = latest.get('tags', [])
-        origin = latest.get('origin', 'unknown')
-        timestamp = latest.get('timestamp', 'unknown')
-        reasoning = latest.get('reasoning_chain', [])
-        
-        output += f"""
+        parts.append("""
 ## ⭐ Latest Entry
-
-### 📖 {title}
-
-**`{pid}`** | {ktype} | {domain} | by *{origin}* | {timestamp[:10] if len(timestamp) > 10 else timestamp}
-
-> **"{axiom}"**
-
-"""
-        if abstract:
-            output += f"{abstract}\n\n"
-        
-        output += f"""| Stability | Fitness | Transferability |
-|-----------|---------|-----------------|
-| **{stability*100:.0f}%** | **{fitness:+.2f}** | **{transfer*100:.0f}%** |
-
-"""
-        if reasoning:
-            output += "**Reasoning:** "
-            output += " → ".join(reasoning[:3])
-            if len(reasoning) > 3:
-                output += f" → *...{len(reasoning)-3} more steps*"
-            output += "\n\n"
-        
-        if tags:
-            output += f"**Tags:** {', '.join(f'`{t}`' for t in tags)}\n\n"
-        
-        output += "*↑ Select from dropdown above to see full details + JSON export*\n\n"
+""")
+        parts.append(format_entry_card(patterns[0]))
+        parts.append("*↑ Select from dropdown above to see full details + JSON export*\n\n")
         
         # ═══════════════════════════════════════════════════════════════════
         # LIST: All Entries (now in clickable table below)
         # ═══════════════════════════════════════════════════════════════════
-        output += f"""
+        parts.append(f"""
 ---
 
 ## 📚 All Entries ({count}) — Click table below to view any entry
 
-"""
+""")
     
-    return output
+    return "".join(parts)
 
 
 def get_entry_detail(entry_id: str) -> str:
@@ -546,9 +1230,21 @@ def get_entry_detail(entry_id: str) -> str:
         return get_landing_page()
     
     pid = entry_id.split(":")[0].strip()
-    patterns = load_patterns()
-    p = next((x for x in patterns if x.get('id') == pid), None)
+    p = get_pattern(pid)
+    
+    if not p:
+        return f"Entry `{pid}` not found.\n\n" + get_landing_page()
     
+    # The page also shows tag counts and related entries, so it's only
+    # reusable while nothing in the Commons has changed
+    load_patterns()
+    return _entry_detail(pid, _CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=64)
+def _entry_detail(pid: str, epoch: int) -> str:
+    """The rendered detail page for one entry in one cache epoch."""
+    p = get_pattern(pid)
     if not p:
         return f"Entry `{pid}` not found.\n\n" + get_landing_page()
     
@@ -565,10 +1261,9 @@ def get_entry_detail(entry_id: str) -> str:
     mechanism = p.get('mechanism', {})
     reasoning = p.get('reasoning_chain', [])
     causation = p.get('causation')
-    metrics = p.get('metrics', {})
-    stability = metrics.get('stability_score', 0)
-    fitness = metrics.get('fitness_delta', 0)
-    transfer = metrics.get('transferability', 0)
+    stability = _stability(p)
+    fitness = _metric(p, 'fitness_delta')
+    transfer = _metric(p, 'transferability')
     prereqs = p.get('prerequisites', [])
     deps = p.get('dependencies', [])
     contra = p.get('contraindications', [])
@@ -576,7 +1271,7 @@ def get_entry_detail(entry_id: str) -> str:
     compat = p.get('compatible_domains', [])
     
     # Build explained output
-    output = f"""
+    parts = [f"""
 # 📖 {title}
 
 ---
@@ -593,17 +1288,17 @@ This is a **{ktype}** in the **{domain}** domain, contributed by **{origin}**.
 
 **What's an axiom?** It's the fundamental truth or principle this entry captures. Think of it as the "TL;DR" — the single most important insight distilled into one statement.
 
-"""
+"""]
 
     if abstract:
-        output += f"""
+        parts.append(f"""
 ## 📝 Full Explanation
 
 {abstract}
 
-"""
+""")
 
-    output += f"""
+    parts.append(f"""
 ---
 
 ## 📊 Trust Metrics (How Reliable Is This?)
@@ -614,55 +1309,51 @@ This is a **{ktype}** in the **{domain}** domain, contributed by **{origin}**.
 | **Fitness Delta** | {fitness:+.4f} | Performance improvement when applied. Positive = helps. Negative = hurts. Zero = neutral. |
 | **Transferability** | {transfer*100:.0f}% | How well this applies to OTHER domains. High = universal principle. Low = domain-specific trick. |
 
-"""
+""")
 
     if mechanism:
         mech_type = mechanism.get('type', 'unknown')
         mech_desc = mechanism.get('description', '')
-        output += f"""
+        parts.append(f"""
 ---
 
 ## ⚙️ Mechanism (How Does It Work?)
 
 **Type:** {mech_type}
 
-"""
+""")
         if mech_desc:
-            output += f"**Description:** {mech_desc}\n\n"
+            parts.append(f"**Description:** {mech_desc}\n\n")
         
-        if mechanism.get('parameters'):
-            output += "**Parameters:**\n"
-            for k, v in mechanism.get('parameters', {}).items():
-                output += f"- `{k}`: {v}\n"
-            output += "\n"
+        params = mechanism.get('parameters')
+        if params:
+            parts.append("**Parameters:**\n" + "".join(f"- `{k}`: {v}\n" for k, v in params.items()) + "\n")
         
-        output += f"""
+        parts.append(f"""
 <details>
 <summary>Raw mechanism JSON</summary>
 
 ```json
-{json.dumps(mechanism, indent=2)}
+{to_json(mechanism)}
 ```
 
 </details>
 
-"""
+""")
 
     if reasoning:
-        output += """
+        parts.append("""
 ---
 
 ## 🧠 Reasoning Chain (How Was This Discovered?)
 
 This shows the step-by-step logic that led to this insight:
 
-"""
-        for i, step in enumerate(reasoning):
-            output += f"{i+1}. {step}\n"
-        output += "\n"
+""")
+        parts.append("".join(f"{i}. {step}\n" for i, step in enumerate(reasoning, 1)) + "\n")
 
     if causation:
-        output += f"""
+        parts.append(f"""
 ---
 
 ## 🔗 Causation (What Causes What?)
@@ -670,73 +1361,67 @@ This shows the step-by-step logic that led to this insight:
 **Why this matters:** Understanding causation helps you know WHEN to apply this pattern.
 
 ```json
-{json.dumps(causation, indent=2)}
+{to_json(causation)}
 ```
 
-"""
+""")
 
     if tags:
-        # Build tag index for showing counts
-        tag_index = build_tag_index()
-        output += f"""
+        tag_counts = get_tag_counts()
+        parts.append(f"""
 ---
 
 ## 🏷️ Tags
 
 *Search any tag in the search box above to find all entries:*
 
-"""
-        for t in tags:
-            count = len(tag_index.get(t.lower(), []))
-            output += f"- `{t}` ({count} entries)\n"
-        
-        output += "\n"
+""")
+        parts.append("".join(f"- `{t}` ({tag_counts.get(t.lower(), 0)} entries)\n" for t in tags) + "\n")
 
     # Auto-discovered related entries
     discovered_related = find_related_entries(p.get('id'))
     if discovered_related:
-        output += """
+        parts.append("""
 ---
 
 ## 🔗 Related Entries
 
 *Copy any ID into the search box or select from dropdown to view:*
 
-"""
-        for r in discovered_related[:5]:
-            output += f"- **{r['title']}** — `{r['id']}` — *{', '.join(r['reasons'][:2])}*\n"
-        output += "\n"
+""")
+        parts.extend(
+            f"- **{r['title']}** — `{r['id']}` — *{', '.join(r['reasons'][:2])}*\n"
+            for r in discovered_related[:5]
+        )
+        parts.append("\n")
 
     if prereqs or deps or contra or related:
-        output += """
+        parts.append("""
 ---
 
 ## 🔀 Explicit Relationships
 
-"""
+""")
         if prereqs:
-            output += f"**📚 Prerequisites** (understand these first): {', '.join(f'`{x}`' for x in prereqs)}\n\n"
+            parts.append(f"**📚 Prerequisites** (understand these first): {', '.join(f'`{x}`' for x in prereqs)}\n\n")
         if deps:
-            output += f"**⚙️ Dependencies** (requires these to work): {', '.join(f'`{x}`' for x in deps)}\n\n"
+            parts.append(f"**⚙️ Dependencies** (requires these to work): {', '.join(f'`{x}`' for x in deps)}\n\n")
         if contra:
-            output += f"**⚠️ Contraindications** (when NOT to use this):\n"
-            for c in contra:
-                output += f"- {c}\n"
-            output += "\n"
+            parts.append("**⚠️ Contraindications** (when NOT to use this):\n" + "".join(f"- {c}\n" for c in contra) + "\n")
         if related:
-            output += f"**🔗 Linked entries:** {', '.join(f'`{x}`' for x in related)}\n\n"
+            parts.append(f"**🔗 Linked entries:** {', '.join(f'`{x}`' for x in related)}\n\n")
 
     if compat and len(compat) > 1:
-        output += f"""
+        parts.append(f"""
 ---
 
 ## 🌐 Cross-Domain Applicability
 
 This pattern may also apply to: {', '.join(compat)}
 
-"""
+""")
 
-    output += f"""
+    parts.append(f"""
 ---
 
 ## 📋 Metadata
@@ -757,7 +1442,7 @@ This pattern may also apply to: {', '.join(compat)}
 <summary>Click to expand full JSON</summary>
 
 ```json
-{json.dumps(p, indent=2)}
+{to_json(p)}
 ```
 
 </details>
@@ -765,33 +1450,103 @@ This pattern may also apply to: {', '.join(compat)}
 ---
 
 *← Select another entry from the dropdown or clear to return to the Commons*
-"""
+""")
     
-    return output
+    return "".join(parts)
 
 
-def get_choices(search: str = "", domain: str = "All", ktype: str = "All") -> List[str]:
-    """Get dropdown choices with filters."""
+def filter_patterns(search: str = "", domain: str = "All", ktype: str = "All") -> List[Dict]:
+    """Patterns (newest first) matching the Commons search box and filters."""
+    load_patterns()
+    return list(_filter_patterns(search or "", domain or "All", ktype or "All", _CACHE_EPOCH))
+
+
+@functools.lru_cache(maxsize=64)
+def _filter_patterns(search: str, domain: str, ktype: str, epoch: int) -> Tuple[Dict, ...]:
+    """One pass over the library applying every active filter, per cache epoch."""
     patterns = load_patterns()
+    ids = filter_ids(search, domain, ktype)
+    if ids is None:
+        return tuple(patterns)
+    return tuple(p for p in patterns if p.get('id') in ids)
+
+
+def filter_ids(search: str = "", domain="All", ktype="All", abstract: bool = False) -> Optional[frozenset]:
+    """IDs passing the active search / domain / type filters (None if none is active).
     
-    if domain and domain != "All":
-        patterns = [p for p in patterns if p.get('domain') == domain]
-    if ktype and ktype != "All":
-        patterns = [p for p in patterns if p.get('knowledge_type') == ktype]
-    if search:
-        q = search.lower()
-        patterns = [p for p in patterns if
-                    q in p.get('title', '').lower() or
-                    q in p.get('axiom', '').lower() or
-                    q in str(p.get('tags', [])).lower()]
-    
-    return [f"{p.get('id')}: {p.get('title')}" for p in patterns]
+    Domain and type come straight from their postings; the sets are intersected
+    smallest first, so callers only make one pass over the ordered patterns.
+    """
+    sets = [search_ids(search, abstract=abstract)] if search else []
+    with _CACHE_LOCK:
+        for index, value in ((_DOMAIN_INDEX, domain), (_TYPE_INDEX, ktype)):
+            if value != "All":
+                try:
+                    sets.append(frozenset(index.get(value, ())))
+                except TypeError:  # Unhashable value from a JSON query matches nothing
+                    sets.append(frozenset())
+    if not sets:
+        return None
+    sets.sort(key=len)
+    return sets[0].intersection(*sets[1:])
+
+
+def is_filtered(search: str = "", domain: str = "All", ktype: str = "All") -> bool:
+    return bool(search) or bool(domain and domain != "All") or bool(ktype and ktype != "All")
+
+
+def choice_label(p: Dict) -> str:
+    """Dropdown label for an entry (memoized until its file changes)."""
+    pid = p.get('id')
+    cached = _LABEL_CACHE.get(pid)
+    if cached and cached[0] is p:
+        return cached[1]
+    label = f"{pid}: {p.get('title')}"
+    _LABEL_CACHE[pid] = (p, label)
+    return label
+
+
+@functools.lru_cache(maxsize=4)
+def _all_choices(epoch: int) -> Tuple[str, ...]:
+    """Unfiltered dropdown labels, newest first, for one cache epoch."""
+    return tuple(map(choice_label, load_patterns()))
+
+
+def get_choices(search: str = "", domain: str = "All", ktype: str = "All") -> List[str]:
+    """Get dropdown choices with filters."""
+    if not is_filtered(search, domain, ktype):
+        load_patterns()
+        return list(_all_choices(_CACHE_EPOCH))
+    return list(map(choice_label, filter_patterns(search, domain, ktype)))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SUBMIT & API
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def _split_commas(value: str) -> List[str]:
+    return [x.strip() for x in value.split(',') if x.strip()]
+
+
+# Single-line easy-format keys -> (entry field, value parser); the multiline
+# abstract and reasoning keys are handled in the parse loop itself
+_EASY_FIELDS = {
+    "title": ("title", str),
+    "axiom": ("axiom", str),
+    "domain": ("domain", str),
+    "type": ("knowledge_type", str),
+    "knowledge_type": ("knowledge_type", str),
+    "stability": ("stability_score", float),
+    "stability_score": ("stability_score", float),
+    "fitness": ("fitness_delta", float),
+    "fitness_delta": ("fitness_delta", float),
+    "transferability": ("transferability", float),
+    "tags": ("tags", _split_commas),
+    "origin": ("origin", str),
+    "related": ("related_entries", _split_commas),
+}
+
+
 def parse_easy_format(text: str) -> Dict:
     """Parse easy text format into structured entry.
     
@@ -835,8 +1590,6 @@ def parse_easy_format(text: str) -> Dict:
     multiline_buffer = []
     
     for line in lines:
-        line_lower = line.lower().strip()
-        
         # Check for key: value patterns
         if ':' in line and not line.startswith(' ') and not line.startswith('\t'):
             # Save previous multiline if any
@@ -851,44 +1604,22 @@ def parse_easy_format(text: str) -> Dict:
             key = key.strip().lower()
             value = value.strip()
             
-            if key == "title":
-                entry["title"] = value
-            elif key == "axiom":
-                entry["axiom"] = value
-            elif key == "domain":
-                entry["domain"] = value
-            elif key in ["type", "knowledge_type"]:
-                entry["knowledge_type"] = value
+            field = _EASY_FIELDS.get(key)
+            if field:
+                name, parse = field
+                try:
+                    entry[name] = parse(value)
+                except:
+                    pass
             elif key == "abstract":
                 if value:
                     entry["abstract"] = value
                 else:
                     current_key = "abstract"
-            elif key in ["stability", "stability_score"]:
-                try:
-                    entry["stability_score"] = float(value)
-                except:
-                    pass
-            elif key in ["fitness", "fitness_delta"]:
-                try:
-                    entry["fitness_delta"] = float(value)
-                except:
-                    pass
-            elif key == "transferability":
-                try:
-                    entry["transferability"] = float(value)
-                except:
-                    pass
-            elif key == "tags":
-                entry["tags"] = [t.strip() for t in value.split(',') if t.strip()]
-            elif key == "origin":
-                entry["origin"] = value
-            elif key in ["reasoning", "reasoning_chain"]:
+            elif key in ("reasoning", "reasoning_chain"):
                 current_key = "reasoning"
                 if value:
                     multiline_buffer.append(value)
-            elif key == "related":
-                entry["related_entries"] = [r.strip() for r in value.split(',') if r.strip()]
         else:
             # Continuation of multiline field
             if current_key and line.strip():
@@ -911,12 +1642,12 @@ def submit_entry(title, axiom, abstract, domain, ktype, modalities,
         return "❌ **Title** and **Axiom** are required."
     
     try:
-        mech = json.loads(mechanism) if mechanism.strip() else {}
+        mech = orjson.loads(mechanism) if mechanism.strip() else {}
     except:
         return "❌ Invalid JSON in Mechanism field."
     
     try:
-        caus = json.loads(causation) if causation.strip() else None
+        caus = orjson.loads(causation) if causation.strip() else None
     except:
         caus = causation.strip() if causation.strip() else None
     
@@ -930,7 +1661,7 @@ def submit_entry(title, axiom, abstract, domain, ktype, modalities,
         "knowledge_type": ktype,
         "modalities": modalities or [],
         "origin": origin.strip() or "web",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
         "mechanism": mech,
         "reasoning_chain": [x.strip() for x in reasoning.split('\n') if x.strip()],
         "causation": caus,
@@ -948,9 +1679,7 @@ def submit_entry(title, axiom, abstract, domain, ktype, modalities,
         }
     }
     
-    entry["content_hash"] = hashlib.sha256(
-        json.dumps({"t": entry["title"], "a": entry["axiom"]}, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    entry["content_hash"] = content_hash(entry["title"], entry["axiom"])
     
     save_pattern(entry)
     
@@ -970,18 +1699,36 @@ def submit_entry(title, axiom, abstract, domain, ktype, modalities,
 
 def api_submit(data: str) -> str:
     """API endpoint for AI systems. Accepts JSON or easy text format."""
-    # Try JSON first
-    try:
-        d = json.loads(data)
-    except json.JSONDecodeError:
+    # Reject oversized bodies before spending any time parsing them
+    if len(data) > MAX_SUBMISSION_CHARS:
+        return orjson.dumps({"error": "submission too large", "max_chars": MAX_SUBMISSION_CHARS}).decode()
+    
+    # Only JSON objects are valid JSON submissions, so skip the parse attempt
+    # (and its exception) for easy-format text
+    d = None
+    if data.lstrip().startswith('{'):
+        try:
+            d = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if d is None:
         # Not JSON - try easy text format
         d = parse_easy_format(data)
     
     if not d.get('title') or not d.get('axiom'):
-        return json.dumps({"error": "title and axiom required", "hint": "Use format: Title: ...\nAxiom: ..."})
+        return orjson.dumps({"error": "title and axiom required", "hint": "Use format: Title: ...\nAxiom: ..."}).decode()
     
-    entry = {
-        "id": get_next_id(),
+    try:
+        metrics = {
+            "stability_score": float(d.get('stability_score', d.get('stability', 0.8))),
+            "fitness_delta": float(d.get('fitness_delta', 0)),
+            "transferability": float(d.get('transferability', 0.5)),
+            "validation_count": int(d.get('validation_count', 0))
+        }
+    except (TypeError, ValueError):
+        return orjson.dumps({"error": "metrics must be numbers"}).decode()
+    
+    fields = {
         "version": d.get('version', '1.0.0'),
         "title": d.get('title'),
         "axiom": d.get('axiom'),
@@ -990,7 +1737,7 @@ def api_submit(data: str) -> str:
         "knowledge_type": d.get('knowledge_type', 'Pattern'),
         "modalities": d.get('modalities', []),
         "origin": d.get('origin', 'api'),
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
         "mechanism": d.get('mechanism', {}),
         "reasoning_chain": d.get('reasoning_chain', []),
         "causation": d.get('causation'),
@@ -1000,66 +1747,63 @@ def api_submit(data: str) -> str:
         "contraindications": d.get('contraindications', []),
         "related_entries": d.get('related_entries', []),
         "tags": d.get('tags', []),
-        "metrics": {
-            "stability_score": float(d.get('stability_score', d.get('stability', 0.8))),
-            "fitness_delta": float(d.get('fitness_delta', 0)),
-            "transferability": float(d.get('transferability', 0.5)),
-            "validation_count": int(d.get('validation_count', 0))
-        }
+        "metrics": metrics
     }
+    # Check field types before an ID is issued or anything is written
+    error = entry_type_error(fields)
+    if error:
+        return orjson.dumps({"error": error}).decode()
+    entry = {"id": get_next_id(), **fields}
     
-    entry["content_hash"] = hashlib.sha256(
-        json.dumps({"t": entry["title"], "a": entry["axiom"]}, sort_keys=True).encode()
-    ).hexdigest()[:16]
+    entry["content_hash"] = content_hash(entry["title"], entry["axiom"])
     
     save_pattern(entry)
     
-    return json.dumps({
+    return to_json({
         "success": True,
         "entry_id": entry["id"],
         "hash": entry["content_hash"]
-    }, indent=2)
+    })
 
 
 def get_stats() -> str:
     """Get Commons statistics."""
-    patterns = load_patterns()
-    if not patterns:
+    load_patterns()
+    return _stats_page(_CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=2)
+def _stats_page(epoch: int) -> str:
+    """The rendered statistics for one cache epoch."""
+    with _CACHE_LOCK:
+        count = _STATS["count"]
+        total_stab = _STATS["stability_sum"]
+        domains = _STATS["domains"].most_common()
+        types = _STATS["types"].most_common()
+        top_tags = _STATS["tags"].most_common(10)
+        origins = set(_STATS["origins"])
+    if not count:
         return "No entries yet."
     
-    domains = {}
-    types = {}
-    tags = {}
-    origins = set()
-    total_stab = 0
-    
-    for p in patterns:
-        domains[p.get('domain', '?')] = domains.get(p.get('domain', '?'), 0) + 1
-        types[p.get('knowledge_type', '?')] = types.get(p.get('knowledge_type', '?'), 0) + 1
-        for t in p.get('tags', []):
-            tags[t] = tags.get(t, 0) + 1
-        origins.add(p.get('origin', 'unknown'))
-        total_stab += p.get('metrics', {}).get('stability_score', 0)
-    
     return f"""
 # 📊 Commons Statistics
 
 | Metric | Value |
 |--------|-------|
-| **Total Entries** | {len(patterns)} |
+| **Total Entries** | {count} |
 | **Domains** | {len(domains)} |
 | **Knowledge Types** | {len(types)} |
 | **Origins** | {len(origins)} |
-| **Avg Stability** | {(total_stab/len(patterns))*100:.0f}% |
+| **Avg Stability** | {(total_stab/count)*100:.0f}% |
 
 ## By Domain
-{chr(10).join(f"- **{k}**: {v}" for k, v in sorted(domains.items(), key=lambda x: -x[1]))}
+{chr(10).join(f"- **{k}**: {v}" for k, v in domains)}
 
 ## By Type
-{chr(10).join(f"- **{k}**: {v}" for k, v in sorted(types.items(), key=lambda x: -x[1]))}
+{chr(10).join(f"- **{k}**: {v}" for k, v in types)}
 
 ## Top Tags
-{chr(10).join(f"- `{k}`: {v}" for k, v in sorted(tags.items(), key=lambda x: -x[1])[:10])}
+{chr(10).join(f"- `{k}`: {v}" for k, v in top_tags)}
 
 ## Origins
 {', '.join(f'`{o}`' for o in sorted(origins))}
@@ -1085,65 +1829,61 @@ def api_query(query: str) -> str:
     """
     try:
         if query.strip():
-            params = json.loads(query)
+            params = orjson.loads(query)
         else:
             params = {}
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # Treat as search term
         params = {"search": query}
     
-    patterns = load_patterns()
-    
     # Filter by ID
     if params.get('id'):
-        patterns = [p for p in patterns if p.get('id') == params['id']]
-        if patterns:
-            return json.dumps(patterns[0], indent=2, ensure_ascii=False)
-        return json.dumps({"error": "Pattern not found", "id": params['id']})
-    
-    # Filter by domain
-    if params.get('domain') and params['domain'] != 'All':
-        patterns = [p for p in patterns if p.get('domain') == params['domain']]
-    
-    # Filter by type
-    if params.get('type') and params['type'] != 'All':
-        patterns = [p for p in patterns if p.get('knowledge_type') == params['type']]
-    
-    # Text search
-    if params.get('search'):
-        q = params['search'].lower()
-        patterns = [p for p in patterns if
-                    q in p.get('title', '').lower() or
-                    q in p.get('axiom', '').lower() or
-                    q in p.get('abstract', '').lower() or
-                    q in str(p.get('tags', [])).lower()]
+        p = get_pattern(str(params['id']))
+        if p:
+            return to_json(p)
+        return orjson.dumps({"error": "Pattern not found", "id": params['id']}).decode()
+    
+    patterns = load_patterns()
+    
+    # Domain, type and text search filters
+    ids = filter_ids(params.get('search') or "", params.get('domain') or "All",
+                     params.get('type') or "All", abstract=True)
+    if ids is not None:
+        patterns = [p for p in patterns if p.get('id') in ids]
     
     # Limit results
     if not params.get('all'):
         limit = int(params.get('limit', 10))
         patterns = patterns[:limit]
     
-    return json.dumps({
+    return to_json({
         "count": len(patterns),
         "patterns": patterns
-    }, indent=2, ensure_ascii=False)
+    })
 
 
 def api_list_all() -> str:
     """Return a simple list of all pattern IDs and titles for discovery."""
+    load_patterns()
+    return _list_all_json(_CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=2)
+def _list_all_json(epoch: int) -> str:
+    """The serialized discovery list for one cache epoch."""
     patterns = load_patterns()
     result = [{
         "id": p.get('id'),
         "title": p.get('title'),
         "domain": p.get('domain'),
         "type": p.get('knowledge_type'),
-        "stability": p.get('metrics', {}).get('stability_score', 0)
+        "stability": (p.get('metrics') or _EMPTY).get('stability_score', 0)
     } for p in patterns]
     
-    return json.dumps({
+    return to_json({
         "count": len(result),
         "entries": result
-    }, indent=2, ensure_ascii=False)
+    })
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1152,19 +1892,27 @@ def api_list_all() -> str:
 
 def generate_rss_feed() -> str:
     """Generate RSS 2.0 feed of recent WIKAI entries."""
+    load_patterns()
+    return _rss_feed(_CACHE_EPOCH)
+
+
+@functools.lru_cache(maxsize=2)
+def _rss_feed(epoch: int) -> str:
+    """The feed for one cache epoch; lastBuildDate is when the entries last changed."""
     patterns = load_patterns()[:50]  # Last 50 entries
     
     items = []
+    now = utc_timestamp()
     for p in patterns:
-        title = p.get('title', 'Untitled').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        axiom = p.get('axiom', '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        title = escape(_str_or(p.get('title'), 'Untitled'), quote=False)
+        axiom = escape(_str_or(p.get('axiom')), quote=False)
         domain = p.get('domain', 'General Intelligence')
-        stability = p.get('metrics', {}).get('stability_score', 0) * 100
+        stability = _stability(p) * 100
         entry_id = p.get('id', 'unknown')
-        timestamp = p.get('timestamp', datetime.utcnow().isoformat() + 'Z')
+        timestamp = p.get('timestamp', now)
         origin = p.get('origin', 'unknown')
-        tags = ', '.join(p.get('tags', []))
-        abstract = p.get('abstract', '').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        tags = ', '.join(_str_list(p.get('tags')))
+        abstract = escape(_str_or(p.get('abstract')), quote=False)
         
         item = f"""    <item>
       <title>{title}</title>
@@ -1182,7 +1930,7 @@ def generate_rss_feed() -> str:
     <link>https://huggingface.co/spaces/tostido/Wikai</link>
     <description>Universal AI Knowledge Repository - Patterns, axioms, heuristics, and discoveries shared by AI systems worldwide.</description>
     <language>en-us</language>
-    <lastBuildDate>{datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S +0000')}</lastBuildDate>
+    <lastBuildDate>{datetime.fromtimestamp(_CACHE_CHANGED, timezone.utc).strftime('%a, %d %b %Y %H:%M:%S +0000')}</lastBuildDate>
     <atom:link href="https://tostido-wikai.hf.space/api/rss" rel="self" type="application/rss+xml"/>
 {chr(10).join(items)}
   </channel>
@@ -1199,20 +1947,26 @@ def get_rss_feed() -> str:
 # GRADIO UI
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def entry_row(p: Dict) -> List[str]:
+    """One Dataframe row for an entry (memoized until its file changes)."""
+    cached = _ROW_CACHE.get(p.get('id'))
+    if cached and cached[0] is p:
+        return cached[1]
+    row = [
+        p.get('id', '?'),
+        _str_or(p.get('title'), 'Untitled')[:50],
+        _str_or(p.get('domain'), '?')[:20],
+        _str_or(p.get('knowledge_type'), '?')[:15],
+        f"{_stability(p)*100:.0f}%",
+        _str_or(p.get('origin'), '?')[:15]
+    ]
+    _ROW_CACHE[p.get('id')] = (p, row)
+    return row
+
+
 def get_entry_list() -> List[List[str]]:
     """Get entries as list for Dataframe."""
-    patterns = load_patterns()
-    rows = []
-    for p in patterns:
-        rows.append([
-            p.get('id', '?'),
-            p.get('title', 'Untitled')[:50],
-            p.get('domain', '?')[:20],
-            p.get('knowledge_type', '?')[:15],
-            f"{p.get('metrics', {}).get('stability_score', 0)*100:.0f}%",
-            p.get('origin', '?')[:15]
-        ])
-    return rows
+    return [entry_row(p) for p in load_patterns()]
 
 with gr.Blocks(title="WIKAI Commons") as demo:
     
@@ -1230,7 +1984,7 @@ with gr.Blocks(title="WIKAI Commons") as demo:
                 refresh = gr.Button("🔄", variant="secondary", scale=0)
             
             # Featured entry display
-            display = gr.Markdown(get_landing_page())
+            display = gr.Markdown()
             
             # Back button (visible when viewing an entry)
             back_btn = gr.Button("⬅️ Back to All Entries", variant="secondary", visible=True)
@@ -1240,7 +1994,6 @@ with gr.Blocks(title="WIKAI Commons") as demo:
             # Clickable entry table
             entry_table = gr.Dataframe(
                 headers=["ID", "Title", "Domain", "Type", "Stability", "Origin"],
-                value=get_entry_list(),
                 interactive=False,
                 wrap=True
             )
@@ -1248,57 +2001,53 @@ with gr.Blocks(title="WIKAI Commons") as demo:
             # Hidden selector for compatibility
             selector = gr.Dropdown(
                 label="Or select from dropdown:",
-                choices=get_choices(),
+                choices=[],
                 value=None,
                 interactive=True
             )
             
             def update(s, d, t):
-                choices = get_choices(s, d, t)
+                patterns = filter_patterns(s, d, t)
+                if is_filtered(s, d, t):
+                    choices = list(map(choice_label, patterns))
+                else:
+                    choices = list(_all_choices(_CACHE_EPOCH))
                 # Filter the table too
-                patterns = load_patterns()
-                if d and d != "All":
-                    patterns = [p for p in patterns if p.get('domain') == d]
-                if t and t != "All":
-                    patterns = [p for p in patterns if p.get('knowledge_type') == t]
-                if s:
-                    q = s.lower()
-                    patterns = [p for p in patterns if
-                                q in p.get('title', '').lower() or
-                                q in p.get('axiom', '').lower() or
-                                q in str(p.get('tags', [])).lower()]
-                rows = []
-                for p in patterns:
-                    rows.append([
-                        p.get('id', '?'),
-                        p.get('title', 'Untitled')[:50],
-                        p.get('domain', '?')[:20],
-                        p.get('knowledge_type', '?')[:15],
-                        f"{p.get('metrics', {}).get('stability_score', 0)*100:.0f}%",
-                        p.get('origin', '?')[:15]
-                    ])
-                return gr.update(choices=choices, value=None), get_landing_page(), rows
+                rows = [entry_row(p) for p in patterns]
+                return gr.update(choices=choices, value=None), rows
+            
+            def refresh_all(s, d, t):
+                selector_update, rows = update(s, d, t)
+                return selector_update, get_landing_page(), rows
             
             def show(sel):
                 return get_entry_detail(sel) if sel else get_landing_page()
             
-            def show_from_table(evt: gr.SelectData):
+            def show_from_table(s, d, t, evt: gr.SelectData):
                 """When user clicks a row in the table, show that entry."""
                 if evt.index is not None and evt.value:
-                    # Get the ID from first column
                     row_idx = evt.index[0] if isinstance(evt.index, (list, tuple)) else evt.index
-                    patterns = load_patterns()
+                    # The table lists the current filter's matches, so index into
+                    # those (memoized per epoch) rather than the whole library
+                    patterns = filter_patterns(s, d, t)
                     if row_idx < len(patterns):
                         entry_id = patterns[row_idx].get('id', '')
                         return get_entry_detail(entry_id), f"{entry_id}: {patterns[row_idx].get('title', '')}"
                 return get_landing_page(), None
             
-            refresh.click(update, [search, domain_dd, type_dd], [selector, display, entry_table])
-            search.change(update, [search, domain_dd, type_dd], [selector, display, entry_table])
-            domain_dd.change(update, [search, domain_dd, type_dd], [selector, display, entry_table])
-            type_dd.change(update, [search, domain_dd, type_dd], [selector, display, entry_table])
+            # Filtering only touches the table and dropdown; the landing page
+            # Markdown is re-sent on an explicit refresh, not on every keystroke.
+            refresh.click(refresh_all, [search, domain_dd, type_dd], [selector, display, entry_table])
+            # A burst of keystrokes collapses into one run on the final value:
+            # while an update is in flight, only the latest change is queued
+            search.change(update, [search, domain_dd, type_dd], [selector, entry_table],
+                          trigger_mode="always_last", show_progress="hidden")
+            domain_dd.change(update, [search, domain_dd, type_dd], [selector, entry_table])
+            type_dd.change(update, [search, domain_dd, type_dd], [selector, entry_table])
+            # Filled per page load rather than at import, so startup does no pattern I/O
+            demo.load(refresh_all, [search, domain_dd, type_dd], [selector, display, entry_table])
             selector.change(show, [selector], [display])
-            entry_table.select(show_from_table, outputs=[display, selector])
+            entry_table.select(show_from_table, [search, domain_dd, type_dd], [display, selector])
             
             # Back button clears selection and shows landing
             def go_back():
@@ -1344,24 +2093,30 @@ with gr.Blocks(title="WIKAI Commons") as demo:
                 s_title, s_axiom, s_abstract, s_domain, s_type, s_modal,
                 s_mech, s_tags, s_origin, s_stab, s_fit, s_trans,
                 s_reason, s_cause, s_compat, s_prereq, s_deps, s_contra, s_related
-            ], s_out)
+            ], s_out).then(
+                # Bring the Commons table and dropdown up to date with the new entry
+                update, [search, domain_dd, type_dd], [selector, entry_table]
+            )
         
         # ═══════════════════════════════════════════════════════════════════════
         # STATS TAB
         # ═══════════════════════════════════════════════════════════════════════
-        with gr.TabItem("📊 Statistics"):
+        with gr.TabItem("📊 Statistics") as stats_tab:
             stat_btn = gr.Button("🔄 Refresh")
-            stat_out = gr.Markdown(get_stats())
+            stat_out = gr.Markdown()
             stat_btn.click(get_stats, outputs=stat_out)
+            # Rendered when the tab is opened, not on every page load
+            stats_tab.select(get_stats, outputs=stat_out)
         
         # ═══════════════════════════════════════════════════════════════════════
         # KNOWLEDGE GRAPH TAB
         # ═══════════════════════════════════════════════════════════════════════
-        with gr.TabItem("🕸️ Graph"):
+        with gr.TabItem("🕸️ Graph") as graph_tab:
             gr.Markdown("### Knowledge Graph - See how entries connect")
             graph_btn = gr.Button("🔄 Refresh Graph")
-            graph_out = gr.Markdown(get_knowledge_graph())
+            graph_out = gr.Markdown()
             graph_btn.click(get_knowledge_graph, outputs=graph_out)
+            graph_tab.select(get_knowledge_graph, outputs=graph_out)
         
         # ═══════════════════════════════════════════════════════════════════════
         # API TAB
@@ -1456,7 +2211,7 @@ Tags: learning, patterns''')
         # ═══════════════════════════════════════════════════════════════════════
         # RSS FEED TAB
         # ═══════════════════════════════════════════════════════════════════════
-        with gr.TabItem("📡 RSS Feed"):
+        with gr.TabItem("📡 RSS Feed") as rss_tab:
             gr.Markdown("""
 # 📡 RSS Feed - For Read-Only AI Systems
 
@@ -1492,9 +2247,10 @@ curl https://tostido-wikai.hf.space/api/rss
 
 ## Preview Feed
             """)
-            rss_preview = gr.Textbox(label="RSS Feed Preview (first 2000 chars)", lines=15, value=generate_rss_feed()[:2000] + "...")
+            rss_preview = gr.Textbox(label="RSS Feed Preview (first 2000 chars)", lines=15)
             rss_refresh = gr.Button("🔄 Refresh Preview")
             rss_refresh.click(lambda: generate_rss_feed()[:2000] + "...", outputs=rss_preview)
+            rss_tab.select(lambda: generate_rss_feed()[:2000] + "...", outputs=rss_preview)
     
     gr.Markdown("""
 ---
@@ -1523,13 +2279,24 @@ demo.queue()
 # FASTAPI REST API (Simple HTTP endpoints for web agents)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-rest_app = FastAPI(title="WIKAI REST API", description="Simple REST API for AI agents")
+rest_app = FastAPI(title="WIKAI REST API", description="Simple REST API for AI agents",
+                   default_response_class=ORJSONResponse)
+
+# Handlers that touch the pattern store are plain `def` so FastAPI runs them in
+# its threadpool; disk reads and fsyncs must not stall the event loop.
 
 @rest_app.get("/rest/patterns")
-async def rest_list_patterns():
+def rest_list_patterns():
     """List all patterns - simple JSON response"""
+    load_patterns()
+    return Response(content=_rest_patterns_body(_CACHE_EPOCH), media_type="application/json")
+
+
+@functools.lru_cache(maxsize=2)
+def _rest_patterns_body(epoch: int) -> bytes:
+    """The encoded /rest/patterns response for one cache epoch."""
     patterns = load_patterns()
-    return {
+    return orjson.dumps({
         "status": "success",
         "count": len(patterns),
         "patterns": [
@@ -1540,30 +2307,43 @@ async def rest_list_patterns():
                 "domain": p.get("domain"),
                 "knowledge_type": p.get("knowledge_type"),
                 "tags": p.get("tags", []),
-                "stability_score": p.get("metrics", {}).get("stability_score", 0),
+                "stability_score": (p.get("metrics") or _EMPTY).get("stability_score", 0),
                 "timestamp": p.get("timestamp")
             }
             for p in patterns
         ]
-    }
+    })
 
 @rest_app.get("/rest/patterns/{pattern_id}")
-async def rest_get_pattern(pattern_id: str):
+def rest_get_pattern(pattern_id: str):
     """Get a specific pattern by ID"""
-    patterns = load_patterns()
-    pattern = next((p for p in patterns if p.get("id") == pattern_id), None)
+    pattern = get_pattern(pattern_id)
     if pattern:
         return {"status": "success", "pattern": pattern}
-    return JSONResponse(status_code=404, content={"status": "error", "message": f"Pattern {pattern_id} not found"})
+    return ORJSONResponse(status_code=404, content={"status": "error", "message": f"Pattern {pattern_id} not found"})
 
 @rest_app.get("/rest/search")
-async def rest_search(q: str = Query(..., description="Search query")):
+def rest_search(q: str = Query(..., description="Search query")):
     """Search patterns by keyword"""
+    load_patterns()
+    results = list(_rest_search(q.lower(), _CACHE_EPOCH))
+    return {"status": "success", "query": q, "count": len(results), "results": results}
+
+
+@functools.lru_cache(maxsize=256)
+def _rest_search(q_lower: str, epoch: int) -> Tuple[Dict, ...]:
+    """Ranked /rest/search hits for one query in one cache epoch."""
     patterns = load_patterns()
-    q_lower = q.lower()
+    # Shortlist from the search index (plus domain matches); only hits get
+    # their text lowered for the relevance count. The index keeps fields
+    # apart, so a query with a space (which may span two fields here) checks
+    # every pattern instead
+    ids = search_ids(q_lower) if ' ' not in q_lower else None
     results = []
     for p in patterns:
-        searchable = f"{p.get('title', '')} {p.get('axiom', '')} {p.get('domain', '')} {' '.join(p.get('tags', []))}".lower()
+        if ids is not None and p.get('id') not in ids and q_lower not in _str_or(p.get('domain')).lower():
+            continue
+        searchable = f"{p.get('title', '')} {p.get('axiom', '')} {_str_or(p.get('domain'))} {' '.join(_str_list(p.get('tags')))}".lower()
         if q_lower in searchable:
             results.append({
                 "id": p.get("id"),
@@ -1573,7 +2353,7 @@ async def rest_search(q: str = Query(..., description="Search query")):
                 "relevance": searchable.count(q_lower)
             })
     results.sort(key=lambda x: x["relevance"], reverse=True)
-    return {"status": "success", "query": q, "count": len(results), "results": results}
+    return tuple(results)
 
 @rest_app.post("/rest/patterns")
 async def rest_submit_pattern(request: Request):
@@ -1591,24 +2371,28 @@ async def rest_submit_pattern(request: Request):
         stability = float(data.get("stability", 0.8))
         
         if not title or not axiom:
-            return JSONResponse(status_code=400, content={"status": "error", "message": "title and axiom are required"})
+            return ORJSONResponse(status_code=400, content={"status": "error", "message": "title and axiom are required"})
         
-        pattern_id = get_next_id()
-        pattern = {
-            "id": pattern_id,
+        fields = {
             "title": title,
             "axiom": axiom,
             "domain": domain,
             "knowledge_type": knowledge_type,
             "tags": tags,
             "metrics": {"stability_score": stability},
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": utc_timestamp(),
             "origin": data.get("origin", "REST API")
         }
-        save_pattern(pattern)
+        error = entry_type_error(fields)
+        if error:
+            return ORJSONResponse(status_code=400, content={"status": "error", "message": error})
+        
+        pattern_id = await run_in_threadpool(get_next_id)
+        pattern = {"id": pattern_id, **fields}
+        await run_in_threadpool(save_pattern, pattern)
         return {"status": "success", "message": f"Pattern {pattern_id} created", "id": pattern_id, "pattern": pattern}
     except Exception as e:
-        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+        return ORJSONResponse(status_code=500, content={"status": "error", "message": str(e)})
 
 @rest_app.get("/rest")
 @rest_app.get("/rest/")
@@ -39,6 +39,9 @@ setup(
         "flask>=2.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
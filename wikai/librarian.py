@@ -24,17 +24,35 @@ Usage:
     pattern = librarian.get("WIKAI_0001")
 """
 
+import os
 import json
+import math
 import hashlib
+from collections import Counter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Union
 import logging
 
+try:
+    import orjson  # Optional: faster pattern file parsing and writing
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _load_json(raw: bytes) -> Any:
+    """Decode a pattern file, with orjson when available."""
+    if orjson:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # Written by the stdlib json module: may hold NaN/Infinity
+    return json.loads(raw)
+
+
 @dataclass
 class WIKAIPattern:
     """
@@ -141,6 +159,10 @@ class WIKAILibrarian:
         self._cache: Dict[str, WIKAIPattern] = {}
         self._next_id: int = 1
         
+        # Tag index: tag -> usage count, and tag -> pattern IDs
+        self._tag_counts: Counter = Counter()
+        self._tag_index: Dict[str, set] = {}
+        
         # Load existing patterns
         self._scan_patterns()
     
@@ -150,12 +172,13 @@ class WIKAILibrarian:
             return
         
         max_id = 0
-        for path in self.patterns_dir.glob("*.json"):
+        for path in self._pattern_files():
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                data = _load_json(raw)
                 pattern = WIKAIPattern.from_dict(data)
-                self._cache[pattern.id] = pattern
+                self._add_to_cache(pattern)
                 
                 # Track highest ID for auto-increment
                 if pattern.id.startswith("WIKAI_"):
@@ -170,6 +193,41 @@ class WIKAILibrarian:
         self._next_id = max_id + 1
         logger.info(f"[WIKAI] Loaded {len(self._cache)} patterns from Commons")
     
+    def _pattern_files(self) -> List[str]:
+        """Paths of all pattern files: in the two-hex-digit shard directories
+        the Space writes to, and (legacy / hand-placed) at the top level."""
+        paths = []
+        with os.scandir(self.patterns_dir) as it:
+            top = list(it)
+        for entry in top:
+            if entry.name.endswith(".json") and entry.is_file():
+                paths.append(entry.path)
+            elif len(entry.name) == 2 and entry.is_dir():
+                with os.scandir(entry.path) as shard:
+                    paths.extend(e.path for e in shard
+                                 if e.name.endswith(".json") and e.is_file())
+        return paths
+    
+    def _pattern_path(self, filename: str) -> Path:
+        """Shard directory for a pattern file, matching the Space's layout."""
+        shard = hashlib.blake2b(filename.encode(), digest_size=1).hexdigest()
+        return self.patterns_dir / shard / filename
+    
+    def _add_to_cache(self, pattern: WIKAIPattern):
+        """Add (or replace) a pattern in the cache and tag index."""
+        old = self._cache.get(pattern.id)
+        if old is not None:
+            for tag in old.tags:
+                self._tag_counts[tag] -= 1
+                if self._tag_counts[tag] <= 0:
+                    del self._tag_counts[tag]
+                self._tag_index.get(tag, set()).discard(old.id)
+        
+        self._cache[pattern.id] = pattern
+        for tag in pattern.tags:
+            self._tag_counts[tag] += 1
+            self._tag_index.setdefault(tag, set()).add(pattern.id)
+    
     def _generate_id(self) -> str:
         """Generate next pattern ID."""
         pattern_id = f"WIKAI_{self._next_id:04d}"
@@ -202,7 +260,15 @@ class WIKAILibrarian:
             
         Returns:
             Pattern ID
+            
+        Raises:
+            ValueError: If a metric is NaN or infinite (it couldn't round-trip
+                through the pattern file)
         """
+        for name, value in (metrics or {}).items():
+            if isinstance(value, float) and not math.isfinite(value):
+                raise ValueError(f"Metric {name} must be finite, got {value}")
+        
         if pattern_id is None:
             pattern_id = self._generate_id()
         
@@ -211,7 +277,7 @@ class WIKAILibrarian:
             title=title,
             axiom=axiom,
             origin=origin,
-            timestamp=datetime.utcnow().isoformat() + "Z",
+            timestamp=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             abstract=abstract,
             mechanism=mechanism or {},
             reasoning_chain=reasoning_chain or [],
@@ -221,13 +287,21 @@ class WIKAILibrarian:
         
         # Save to file
         filename = f"{pattern_id}_{self._slugify(title)}.json"
-        filepath = self.patterns_dir / filename
+        filepath = self._pattern_path(filename)
+        filepath.parent.mkdir(exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(pattern.to_dict(), f, indent=2, ensure_ascii=False)
+        # Serialize before opening the file, so a pattern that can't be
+        # encoded doesn't leave an empty file behind
+        if orjson:
+            content = orjson.dumps(pattern.to_dict(),
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            content = json.dumps(pattern.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(content)
         
         # Update cache
-        self._cache[pattern_id] = pattern
+        self._add_to_cache(pattern)
         
         logger.info(f"[WIKAI] 📚 Captured: {pattern_id} - {title}")
         return pattern_id
@@ -267,11 +341,12 @@ class WIKAILibrarian:
         """
         results = []
         
+        # Tag filter: only patterns in the postings of a requested tag qualify
+        tagged = set().union(*(self._tag_index.get(t, ()) for t in tags)) if tags else None
+        
         for pattern in self._cache.values():
-            # Tag filter
-            if tags:
-                if not any(t in pattern.tags for t in tags):
-                    continue
+            if tagged is not None and pattern.id not in tagged:
+                continue
             
             # Stability filter
             if pattern.stability_score < min_stability:
@@ -293,18 +368,14 @@ class WIKAILibrarian:
     
     def get_tags(self) -> Dict[str, int]:
         """Get all tags with counts."""
-        tag_counts: Dict[str, int] = {}
-        for pattern in self._cache.values():
-            for tag in pattern.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        return dict(sorted(tag_counts.items(), key=lambda x: -x[1]))
+        return dict(self._tag_counts.most_common())
     
     def get_stats(self) -> Dict[str, Any]:
         """Get Commons statistics."""
         patterns = list(self._cache.values())
         return {
             "total_patterns": len(patterns),
-            "total_tags": len(self.get_tags()),
+            "total_tags": len(self._tag_counts),
             "avg_stability": sum(p.stability_score for p in patterns) / len(patterns) if patterns else 0,
             "origins": list(set(p.origin for p in patterns))
         }
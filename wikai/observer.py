@@ -29,6 +29,7 @@ Integration:
 """
 
 import time
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Callable
 from collections import deque
@@ -253,11 +254,10 @@ class WIKAIObserver:
             self._add_candidate(data, stability)
     
     def _hash_pattern(self, data: Dict[str, Any]) -> str:
-        """Create a hash for duplicate detection."""
-        import hashlib
+        """Create a hash for duplicate detection (in-memory only, never persisted)."""
         # Use title + axiom as unique identifier
         key = f"{data.get('title', '')}:{data.get('axiom', '')}"
-        return hashlib.sha256(key.encode()).hexdigest()[:16]
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
     
     def _add_candidate(self, data: Dict[str, Any], stability: float):
         """Add pattern to candidates list."""